@@ -16,6 +16,8 @@ import threading
 import signal
 import sys
 import re
+import math
+from collections import deque
 
 # .env 파일 로드
 load_dotenv()
@@ -26,6 +28,15 @@ OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 NOTION_TOKEN = os.getenv('NOTION_TOKEN')
 NOTION_DATABASE_ID = os.getenv('NOTION_DATABASE_ID')
 
+# 음성 인식 요청 헤징 설정 (STT_HEDGING=1 일 때만 활성화)
+STT_HEDGING = os.getenv('STT_HEDGING', '0') == '1'
+STT_HEDGE_PERCENTILE = float(os.getenv('STT_HEDGE_PERCENTILE', '95'))
+STT_HEDGE_MAX_RATIO = float(os.getenv('STT_HEDGE_MAX_RATIO', '0.1'))
+STT_OPERATION_TIMEOUT = float(os.getenv('STT_OPERATION_TIMEOUT', '60'))
+
+# 백엔드 상태 확인 주기 (초)
+HEALTH_CHECK_INTERVAL = float(os.getenv('HEALTH_CHECK_INTERVAL', '300'))
+
 # OpenAI API 키 설정
 client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 # Notion 클라이언트 초기화
@@ -166,9 +177,142 @@ class AudioReceiver(discord.VoiceClient):
             self.p.terminate()
         await super().disconnect()
 
-async def transcribe_audio(audio_file):
-    """음성 파일을 텍스트로 변환 - 청크 단위로 처리"""
+def percentile(values, pct):
+    """값 목록의 백분위수 계산 (nearest-rank)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def recognize_google_ko(audio):
+    """Google 음성 인식 (스레드마다 별도 Recognizer 사용)"""
     recognizer = sr.Recognizer()
+    # 응답이 없는 요청이 executor 스레드를 계속 점유하지 않도록 제한
+    recognizer.operation_timeout = STT_OPERATION_TIMEOUT
+    try:
+        return recognizer.recognize_google(audio, language='ko-KR')
+    except OSError as e:
+        # 응답 지연으로 인한 TimeoutError 등은 RequestError로 변환되지 않으므로 직접 변환
+        raise sr.RequestError(f"recognition connection failed: {e}")
+
+class HedgedRecognizer:
+    """음성 인식 요청 헤징 - 느린 청크의 꼬리 지연 단축
+
+    요청이 최근 지연 시간의 백분위수(percentile)를 넘도록 응답이 없으면
+    같은 요청을 한 번 더 보내고 먼저 도착한 결과를 사용합니다.
+    헤징 요청 수는 전체 요청 대비 비율과 동시 실행 개수로 제한됩니다.
+    """
+    def __init__(self, recognize_fn=recognize_google_ko, enabled=True,
+                 hedge_percentile=95, max_hedge_ratio=0.1, max_inflight_hedges=2,
+                 initial_delay=8.0, min_delay=0.5, min_samples=10, window=200):
+        self.recognize_fn = recognize_fn
+        self.enabled = enabled
+        self.hedge_percentile = hedge_percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_inflight_hedges = max_inflight_hedges
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        
+        # 최근 지연 시간 기록 (초) - 비교를 위해 두 기록 모두 실패한 요청 포함
+        self.primary_latencies = deque(maxlen=window)   # 첫 요청 기준 (헤징 없었을 때의 지연)
+        self.response_latencies = deque(maxlen=window)  # 실제 결과를 받기까지의 지연
+        # 헤징 대기 시간 계산용 (빠르게 실패하는 무음 청크 등은 제외)
+        self.success_latencies = deque(maxlen=window)
+        
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.inflight_hedges = 0
+    
+    def hedge_delay(self):
+        """헤징 요청을 보낼 때까지 기다릴 시간 (최근 지연 시간의 백분위수)"""
+        if len(self.success_latencies) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, percentile(self.success_latencies, self.hedge_percentile))
+    
+    def _can_hedge(self):
+        """추가 부하 제한 확인"""
+        if self.inflight_hedges >= self.max_inflight_hedges:
+            return False
+        return self.hedges <= self.max_hedge_ratio * self.requests
+    
+    def _submit(self, audio, is_hedge):
+        """음성 인식 요청을 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        future = loop.run_in_executor(None, self.recognize_fn, audio)
+        
+        def _on_done(fut):
+            if is_hedge:
+                self.inflight_hedges -= 1
+            elif not fut.cancelled():
+                # 헤징 응답에 밀린 뒤 늦게 끝나거나 실패한 요청도 기록
+                latency = time.monotonic() - started
+                self.primary_latencies.append(latency)
+                if fut.exception() is None:
+                    self.success_latencies.append(latency)
+            # 사용되지 않은 요청의 예외가 경고로 남지 않도록 확인
+            if not fut.cancelled():
+                fut.exception()
+        
+        if is_hedge:
+            self.inflight_hedges += 1
+        future.add_done_callback(_on_done)
+        return future
+    
+    async def recognize(self, audio):
+        """음성 인식 - 필요 시 헤징 요청을 보내고 먼저 성공한 결과 반환"""
+        self.requests += 1
+        started = time.monotonic()
+        primary = self._submit(audio, is_hedge=False)
+        pending = {primary}
+        
+        if self.enabled:
+            await asyncio.wait(pending, timeout=self.hedge_delay())
+            if not primary.done() and self._can_hedge():
+                self.hedges += 1
+                pending.add(self._submit(audio, is_hedge=True))
+        
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is None:
+                    self.response_latencies.append(time.monotonic() - started)
+                    if fut is not primary:
+                        self.hedge_wins += 1
+                    return fut.result()
+                error = error or fut.exception()
+        
+        self.response_latencies.append(time.monotonic() - started)
+        raise error
+    
+    def stats(self):
+        """헤징 비율 및 지연 시간 통계"""
+        return {
+            'requests': self.requests,
+            'hedges': self.hedges,
+            'hedge_rate': self.hedges / self.requests if self.requests else 0.0,
+            'hedge_wins': self.hedge_wins,
+            'hedge_delay': self.hedge_delay(),
+            'primary_p50': percentile(self.primary_latencies, 50),
+            'primary_p99': percentile(self.primary_latencies, 99),
+            'response_p50': percentile(self.response_latencies, 50),
+            'response_p99': percentile(self.response_latencies, 99),
+        }
+
+# 음성 인식기 (지연 기록이 회의 간에 유지되도록 전역으로 사용)
+speech_recognizer = HedgedRecognizer(
+    enabled=STT_HEDGING,
+    hedge_percentile=STT_HEDGE_PERCENTILE,
+    max_hedge_ratio=STT_HEDGE_MAX_RATIO
+)
+
+async def transcribe_audio(audio_file, recognizer=None):
+    """음성 파일을 텍스트로 변환 - 청크 단위로 처리"""
+    recognizer = recognizer or speech_recognizer
     try:
         # 오디오 파일을 여러 청크로 분할
         audio_data = AudioSegment.from_wav(audio_file)
@@ -178,22 +322,27 @@ async def transcribe_audio(audio_file):
         full_text = []
         for i, chunk in enumerate(chunks):
             # 임시 파일로 저장
-            chunk_file = f"temp_chunk_{i}.wav"
+            chunk_file = f"temp_chunk_{os.path.splitext(os.path.basename(audio_file))[0]}_{i}.wav"
             chunk.export(chunk_file, format="wav")
             
-            # 음성 인식
-            with sr.AudioFile(chunk_file) as source:
-                audio = recognizer.record(source)
-                try:
-                    text = recognizer.recognize_google(audio, language='ko-KR')
-                    full_text.append(text)
-                except sr.UnknownValueError:
-                    print(f"Chunk {i}: Speech not recognized")
-                except sr.RequestError as e:
-                    print(f"Chunk {i}: Could not request results; {e}")
-            
-            # 임시 파일 삭제
-            os.remove(chunk_file)
+            try:
+                # 음성 인식
+                with sr.AudioFile(chunk_file) as source:
+                    audio = sr.Recognizer().record(source)
+                    try:
+                        text = await recognizer.recognize(audio)
+                        full_text.append(text)
+                    except sr.UnknownValueError:
+                        print(f"Chunk {i}: Speech not recognized")
+                    except sr.RequestError as e:
+                        print(f"Chunk {i}: Could not request results; {e}")
+            finally:
+                # 임시 파일 삭제
+                os.remove(chunk_file)
+        if recognizer.enabled:
+            stats = recognizer.stats()
+            print(f"STT hedging: {stats['hedges']}/{stats['requests']} hedged, "
+                  f"p99 {stats['response_p99'] or 0:.2f}s (without hedging {stats['primary_p99'] or 0:.2f}s)")
         joined_text = " ".join(full_text)
         return preprocess_text(joined_text)
     except Exception as e:
@@ -386,6 +535,108 @@ async def create_notion_page(notion_client, database_id, meeting_data):
     
     return notion_client.pages.create(**new_page)
 
+async def send_long(ctx, text, limit=1900):
+    """Discord 메시지 길이 제한에 맞춰 나누어 전송"""
+    for i in range(0, len(text), limit):
+        await ctx.send(text[i:i+limit])
+
+# 상태 보고에 표시할 백엔드 이름
+BACKEND_NAMES = {'discord': 'Discord', 'openai': 'OpenAI', 'notion': 'Notion'}
+
+class HealthMonitor:
+    """백엔드 상태 백그라운드 확인 - 최근 지연 시간 및 오류율 기록
+
+    각 백엔드(Discord, OpenAI, Notion)를 비용이 들지 않는 요청으로 주기적으로 동시에 확인하고,
+    명령어와 회의 처리 과정은 저장된 기록으로 즉시 상태를 판단합니다.
+    """
+    BACKENDS = ('discord', 'openai', 'notion')
+    
+    def __init__(self, bot, interval=300, timeout=10, window=50):
+        self.bot = bot
+        self.interval = interval
+        self.timeout = timeout
+        # 백엔드별 확인 기록: (확인 시각, 지연 시간(초), 오류 메시지 또는 None)
+        self.history = {name: deque(maxlen=window) for name in self.BACKENDS}
+        self.task = None
+    
+    async def _probe_discord(self):
+        """Discord 게이트웨이 하트비트 지연 (별도 요청 없음)"""
+        if not self.bot.is_ready() or not math.isfinite(self.bot.latency):
+            raise RuntimeError("게이트웨이 연결 대기 중")
+        return self.bot.latency
+    
+    async def _probe_openai(self):
+        """OpenAI 모델 조회 (토큰을 사용하지 않는 요청)"""
+        start_time = time.monotonic()
+        await client.models.retrieve("gpt-4o-mini")
+        return time.monotonic() - start_time
+    
+    async def _probe_notion(self):
+        """Notion 데이터베이스 조회 (동기 클라이언트를 스레드에서 실행)"""
+        start_time = time.monotonic()
+        await asyncio.to_thread(self.bot.notion.databases.retrieve, database_id=self.bot.notion_database_id)
+        return time.monotonic() - start_time
+    
+    async def probe(self, name):
+        """백엔드 하나를 확인하고 기록"""
+        checked_at = time.time()
+        try:
+            latency = await asyncio.wait_for(getattr(self, f"_probe_{name}")(), timeout=self.timeout)
+            self.history[name].append((checked_at, latency, None))
+        except asyncio.TimeoutError:
+            self.history[name].append((checked_at, None, f"{self.timeout}초 내 응답 없음"))
+        except Exception as e:
+            self.history[name].append((checked_at, None, str(e)))
+    
+    async def probe_all(self, names=None):
+        """백엔드 동시 확인"""
+        await asyncio.gather(*(self.probe(name) for name in names or self.BACKENDS))
+    
+    async def _run(self):
+        """주기적 확인 루프 (첫 확인은 setup_hook과 on_ready에서 실행)"""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.probe_all()
+    
+    def start(self):
+        """백그라운드 확인 시작"""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+    
+    def stop(self):
+        """백그라운드 확인 중지"""
+        if self.task:
+            self.task.cancel()
+            self.task = None
+    
+    def is_healthy(self, name):
+        """마지막 확인 결과가 정상인지 여부 (기록이 없으면 정상으로 간주)"""
+        history = self.history[name]
+        return not history or history[-1][2] is None
+    
+    async def ensure_healthy(self, *names):
+        """비정상으로 기록된 백엔드를 다시 확인하고, 여전히 비정상인 백엔드 목록 반환"""
+        unhealthy = [name for name in names if not self.is_healthy(name)]
+        if unhealthy:
+            await self.probe_all(unhealthy)
+        return [name for name in unhealthy if not self.is_healthy(name)]
+    
+    def stats(self, name):
+        """백엔드별 상태 요약"""
+        history = self.history[name]
+        latencies = [latency for _, latency, error in history if error is None]
+        last = history[-1] if history else None
+        return {
+            'checks': len(history),
+            'healthy': self.is_healthy(name),
+            'error_rate': (len(history) - len(latencies)) / len(history) if history else 0.0,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'last_latency': last[1] if last else None,
+            'last_error': last[2] if last else None,
+            'last_checked': last[0] if last else None,
+        }
+
 class MeetingBot(commands.Bot):
     def __init__(self, notion_token, notion_database_id):
         intents = discord.Intents.default()
@@ -397,6 +648,7 @@ class MeetingBot(commands.Bot):
         self.notion = Client(auth=notion_token)
         self.notion_database_id = notion_database_id
         self.current_meeting = None
+        self.health_monitor = HealthMonitor(self, interval=HEALTH_CHECK_INTERVAL)
         
     async def setup_hook(self):
         print("\n=== API 연결 테스트 시작 ===")
@@ -406,27 +658,35 @@ class MeetingBot(commands.Bot):
         print(f"✓ 봇 이름: {self.user.name}")
         print(f"✓ 봇 ID: {self.user.id}")
         
-        # OpenAI 연결 테스트
+        # OpenAI, Notion 연결 테스트 (동시 실행)
+        await self.health_monitor.probe_all(['openai', 'notion'])
+        
         print("\n2. OpenAI API 테스트:")
-        try:
-            response = await client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": "테스트"}],
-                max_tokens=5
-            )
+        stats = self.health_monitor.stats('openai')
+        if stats['healthy']:
             print("✓ OpenAI API 연결 성공")
-        except Exception as e:
-            print(f"✗ OpenAI API 연결 실패: {str(e)}")
+        else:
+            print(f"✗ OpenAI API 연결 실패: {stats['last_error']}")
         
-        # Notion 연결 테스트
         print("\n3. Notion API 테스트:")
-        try:
-            self.notion.databases.retrieve(database_id=self.notion_database_id)
+        stats = self.health_monitor.stats('notion')
+        if stats['healthy']:
             print("✓ Notion API 연결 및 데이터베이스 접근 성공")
-        except Exception as e:
-            print(f"✗ Notion API 연결 실패: {str(e)}")
+        else:
+            print(f"✗ Notion API 연결 실패: {stats['last_error']}")
         
         print("\n=== API 연결 테스트 완료 ===")
+        
+        # 백그라운드 상태 확인 시작
+        self.health_monitor.start()
+    
+    async def on_ready(self):
+        # setup_hook 시점에는 게이트웨이 연결 전이므로 준비 완료 후 Discord 상태 확인
+        await self.health_monitor.probe('discord')
+    
+    async def close(self):
+        self.health_monitor.stop()
+        await super().close()
 
 # bot 인스턴스 생성
 bot = MeetingBot(
@@ -459,6 +719,10 @@ async def start(ctx, *, title: str = None, duration: int = 60):
             'attendees': ', '.join(attendees)
         }
         
+        unhealthy = [name for name in ('openai', 'notion') if not bot.health_monitor.is_healthy(name)]
+        if unhealthy:
+            await ctx.send(f"⚠️ 현재 {', '.join(BACKEND_NAMES[name] for name in unhealthy)} API 연결에 문제가 있어 회의록 생성이 실패할 수 있습니다.")
+        
         await ctx.send(f"'{title}' 회의 녹음을 시작합니다.\n참석자: {', '.join(attendees)}\회의 녹음은 더 정확한 요약을 위해 {duration}분 후에 자동으로 종료됩니다.\n ")
         
         # 자동 종료 타이머 설정
@@ -485,11 +749,24 @@ async def stop(ctx):
             if voice_client.write_to_wav(filename):
                 await status_message.edit(content="처리 진행률:\n⬛⬜⬜⬜⬜ 20%")
                 
+                # 요약/저장에 필요한 API 상태 확인 (장애가 있는 단계는 건너뛰고 결과를 채널에 전송)
+                unhealthy = await bot.health_monitor.ensure_healthy('openai', 'notion')
+                if unhealthy:
+                    fallback = "요약 없이 음성 인식 결과만" if 'openai' in unhealthy else "Notion 저장 없이 회의록을"
+                    await ctx.send(f"⚠️ {', '.join(BACKEND_NAMES[name] for name in unhealthy)} API 연결에 문제가 있어 "
+                                   f"{fallback} 채널에 전송합니다.")
+                
                 # 음성을 텍스트로 변환
                 transcript = await transcribe_audio(filename)
                 if transcript:
                     await status_message.edit(content="처리 진행률:\n⬛⬛⬜⬜⬜ 40%")
                     
+                    # OpenAI 장애 시 요약 없이 음성 인식 결과만 전송
+                    if 'openai' in unhealthy:
+                        await status_message.edit(content="처리 진행률:\n⬛⬛⬜⬜⬜ 40% (요약 생략)")
+                        await send_long(ctx, "회의 전체 내용:\n" + transcript)
+                        return
+                    
                     # 텍스트 요약
                     summary = await summarize_with_template(transcript)
                     if summary:
@@ -510,6 +787,13 @@ async def stop(ctx):
                         
                         await status_message.edit(content="처리 진행률:\n⬛⬛⬛⬛⬜ 80%")
                         
+                        # Notion 장애 시 저장 없이 요약과 전체 내용을 채널에 전송
+                        if 'notion' in unhealthy:
+                            await status_message.edit(content="처리 진행률:\n⬛⬛⬛⬛⬜ 80% (Notion 저장 생략)")
+                            await send_long(ctx, "회의 요약:\n" + MEETING_TEMPLATE.format(**meeting_data))
+                            await send_long(ctx, "회의 전체 내용:\n" + transcript)
+                            return
+                        
                         # Notion 페이지 생성
                         try:
                             page = await create_notion_page(bot.notion, bot.notion_database_id, meeting_data)
@@ -562,80 +846,70 @@ async def bot_guide(ctx):
 
     
 
+def format_ms(seconds):
+    """초 단위 지연 시간을 ms 문자열로 변환"""
+    return "-" if seconds is None else f"{round(seconds * 1000)}ms"
+
+def format_health_age(checked_at):
+    """마지막 확인 이후 경과 시간"""
+    if checked_at is None:
+        return "확인 기록 없음"
+    return f"{round(time.time() - checked_at)}초 전 확인"
+
 # test 명령어 추가
 @bot.command(name='test')
 @commands.is_owner()  # 봇 소유자만 실행 가능
 async def test_connections(ctx):
-    """API 연결 상태 테스트"""
-    message = await ctx.send("🔍 API 연결 상태 확인 중...")
-    
+    """API 연결 상태 (백그라운드 확인 결과)"""
     results = []
     results.append("🤖 **API 연결 상태**")
     
-    # Discord
-    try:
-        await bot.wait_until_ready()
-        results.append("✅ Discord: 정상")
-    except Exception as e:
-        results.append(f"❌ Discord: {str(e)}")
-    
-    # OpenAI
-    try:
-        await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": "test"}],
-            max_tokens=5
-        )
-        results.append("✅ OpenAI: 정상")
-    except Exception as e:
-        results.append(f"❌ OpenAI: {str(e)}")
-    
-    # Notion
-    try:
-        bot.notion.users.list()
-        results.append("✅ Notion: 정상")
-    except Exception as e:
-        results.append(f"❌ Notion: {str(e)}")
+    for key, name in BACKEND_NAMES.items():
+        stats = bot.health_monitor.stats(key)
+        if stats['checks'] == 0:
+            results.append(f"❔ {name}: 확인 기록 없음")
+        elif stats['healthy']:
+            results.append(f"✅ {name}: 정상 ({format_health_age(stats['last_checked'])})")
+        else:
+            results.append(f"❌ {name}: {stats['last_error']} ({format_health_age(stats['last_checked'])})")
     
-    await message.edit(content="\n".join(results))
+    await ctx.send("\n".join(results))
 @bot.command(name='apitest')
 @commands.is_owner()
 async def test_apis(ctx):
-    """실시간 API 상태 확인"""
-    status_msg = await ctx.send("🔄 API 상태 확인 중...")
-    
+    """API 상태 보고서 (최근 지연 시간 및 오류율)"""
     results = []
     results.append("📊 **API 상태 보고서**")
     
-    # Discord 테스트
-    results.append("\n**Discord**")
-    results.append(f"✓ 봇 응답 시간: {round(bot.latency * 1000)}ms")
+    for key, name in BACKEND_NAMES.items():
+        stats = bot.health_monitor.stats(key)
+        results.append(f"\n**{name}**")
+        if stats['checks'] == 0:
+            results.append("확인 기록 없음")
+            continue
+        results.append(f"{'✓' if stats['healthy'] else '✗'} 최근 응답 시간: {format_ms(stats['last_latency'])} ({format_health_age(stats['last_checked'])})")
+        results.append(f"p50/p95: {format_ms(stats['p50'])} / {format_ms(stats['p95'])}")
+        results.append(f"오류율: {stats['error_rate'] * 100:.0f}% (최근 {stats['checks']}회)")
+        if not stats['healthy']:
+            results.append(f"✗ 연결 오류: {stats['last_error']}")
     
-    # OpenAI 테스트
-    results.append("\n**OpenAI**")
-    try:
-        start_time = time.time()
-        await client.chat.completions.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": "test"}],
-            max_tokens=5
-        )
-        api_time = (time.time() - start_time) * 1000
-        results.append(f"✓ API 응답 시간: {round(api_time)}ms")
-    except Exception as e:
-        results.append(f"✗ 연결 오류: {str(e)}")
+    await ctx.send("\n".join(results))
+@bot.command(name='sttstats')
+@commands.is_owner()
+async def stt_stats(ctx):
+    """음성 인식 헤징 통계"""
+    stats = speech_recognizer.stats()
     
-    # Notion 테스트
-    results.append("\n**Notion**")
-    try:
-        start_time = time.time()
-        bot.notion.databases.retrieve(database_id=bot.notion_database_id)
-        api_time = (time.time() - start_time) * 1000
-        results.append(f"✓ API 응답 시간: {round(api_time)}ms")
-    except Exception as e:
-        results.append(f"✗ 연결 오류: {str(e)}")
+    results = []
+    results.append("🎙️ **음성 인식 통계**")
+    results.append(f"헤징: {'사용' if speech_recognizer.enabled else '사용 안 함'}")
+    results.append(f"요청 수: {stats['requests']}")
+    results.append(f"헤징 비율: {stats['hedge_rate'] * 100:.1f}% ({stats['hedges']}회, 헤징 응답 채택 {stats['hedge_wins']}회)")
+    results.append(f"헤징 대기 시간: {format_ms(stats['hedge_delay'])}")
+    results.append(f"응답 지연 p50/p99: {format_ms(stats['response_p50'])} / {format_ms(stats['response_p99'])}")
+    results.append(f"헤징 없을 때 p50/p99: {format_ms(stats['primary_p50'])} / {format_ms(stats['primary_p99'])}")
     
-    await status_msg.edit(content="\n".join(results))
+    await ctx.send("\n".join(results))
 def signal_handler(sig, frame):
     """프로그램 종료 시 정리 작업 수행"""
     print("\n프로그램을 종료합니다...")
@@ -649,8 +923,6 @@ def signal_handler(sig, frame):
     asyncio.run(bot.close())
     sys.exit(0)
 
-# 시그널 핸들러 등록
-signal.signal(signal.SIGINT, signal_handler)
 
 #Page 생성 Test용 코드
 def create_page():
@@ -699,8 +971,12 @@ def create_page():
     except Exception as e:
         print(f"❌ 오류 발생: {str(e)}")
         return None
-try:
-    print("봇 시작 시도 중...")
-    bot.run(DISCORD_TOKEN)
-except Exception as e:
-    print(f"봇 실행 중 오류 발생: {str(e)}")
\ No newline at end of file
+if __name__ == '__main__':
+    # 시그널 핸들러 등록
+    signal.signal(signal.SIGINT, signal_handler)
+    
+    try:
+        print("봇 시작 시도 중...")
+        bot.run(DISCORD_TOKEN)
+    except Exception as e:
+        print(f"봇 실행 중 오류 발생: {str(e)}")
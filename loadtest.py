@@ -0,0 +1,450 @@
+"""MeetingBot 다중 길드 동시 부하/장시간(soak) 테스트
+
+가짜 Discord 컨텍스트와 합성 오디오를 사용하는 AudioReceiver로 !start/!stop 명령을
+직접 실행합니다. 음성 인식, OpenAI, Notion은 지연 시간을 주입할 수 있는 로컬 대체 구현을
+사용하므로 실제 API 호출은 발생하지 않습니다.
+
+사용 예:
+    python loadtest.py --meetings 30 --hours 2 --meeting-length 60
+"""
+import argparse
+import array
+import asyncio
+import glob
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+
+import discord
+
+# app 모듈 로드 시 필요한 환경 변수 (실제 API는 사용하지 않음)
+os.environ.setdefault('OPENAI_API_KEY', 'loadtest')
+os.environ.setdefault('NOTION_TOKEN', 'loadtest')
+os.environ.setdefault('NOTION_DATABASE_ID', 'loadtest')
+
+import app
+
+
+def sample_latency(median, tail_prob, tail_factor):
+    """대체 API 지연 시간 생성 (로그정규 분포 + 일정 확률의 느린 응답)"""
+    latency = random.lognormvariate(math.log(median), 0.25)
+    if random.random() < tail_prob:
+        latency *= tail_factor
+    return latency
+
+
+class FakeStream:
+    """PyAudio 입력 스트림 대체 - 실시간 속도로 합성 오디오(사인파) 생성"""
+    def __init__(self, rate, channels, chunk):
+        self.rate = rate
+        self.chunk = chunk
+        freq = random.uniform(200, 400)
+        samples = array.array('h', (
+            int(8000 * math.sin(2 * math.pi * freq * (i // channels) / rate))
+            for i in range(chunk * channels)
+        ))
+        self.data = samples.tobytes()
+
+    def read(self, num_frames):
+        time.sleep(num_frames / self.rate)
+        return self.data
+
+    def stop_stream(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakePyAudio:
+    """PyAudio 대체"""
+    def open(self, format, channels, rate, input, frames_per_buffer):
+        return FakeStream(rate, channels, frames_per_buffer)
+
+    def get_sample_size(self, format):
+        return 2
+
+    def terminate(self):
+        pass
+
+
+class FakeAudioReceiver(app.AudioReceiver):
+    """음성 채널 연결 없이 합성 오디오를 녹음하는 AudioReceiver"""
+    # 연결 해제되지 않은 수신기 (테스트 종료 시 남은 녹음 스레드 정리용)
+    active = set()
+
+    def __init__(self, guild, rate, channels):
+        # discord.VoiceClient 초기화는 실제 연결이 필요하므로 건너뜀
+        self.guild_ref = guild
+        self.recording = False
+        self.frames = []
+
+        self.CHUNK = 1024
+        self.FORMAT = None
+        self.CHANNELS = channels
+        self.RATE = rate
+
+        self.p = FakePyAudio()
+        self.stream = None
+        self.record_thread = None
+        # 이 녹음을 종료한 컨텍스트 (다른 회의의 자동 종료 타이머 감지용)
+        self.stopped_by = None
+        FakeAudioReceiver.active.add(self)
+
+    async def disconnect(self):
+        """연결 종료"""
+        if self.recording:
+            self.stop_recording()
+        self.p.terminate()
+        FakeAudioReceiver.active.discard(self)
+        if self.guild_ref.voice_client is self:
+            self.guild_ref.voice_client = None
+
+
+class FakeMessage:
+    def __init__(self, content):
+        self.content = content
+
+    async def edit(self, content):
+        self.content = content
+
+
+class FakeVoiceChannel:
+    def __init__(self, guild, name, members, rate, channels):
+        self.guild = guild
+        self.name = name
+        self.members = members
+        self.rate = rate
+        self.channels = channels
+        self.connect_count = 0
+        self.last_connection = None
+
+    async def connect(self, cls=None):
+        # discord.py와 동일하게 이미 연결된 길드에서는 연결 실패
+        if self.guild.voice_client is not None:
+            raise discord.ClientException('Already connected to a voice channel.')
+        voice_client = FakeAudioReceiver(self.guild, self.rate, self.channels)
+        self.guild.voice_client = voice_client
+        self.connect_count += 1
+        self.last_connection = voice_client
+        return voice_client
+
+
+class FakeContext:
+    """commands.Context 대체 - 명령어 핸들러가 사용하는 속성만 구현"""
+    def __init__(self, guild, channel_id, voice_channel):
+        self.guild = guild
+        self.channel = SimpleNamespace(id=channel_id)
+        self.author = SimpleNamespace(name='loadtest', voice=SimpleNamespace(channel=voice_channel))
+        self.sent = []
+        self.auto_stop_latency = None
+
+    @property
+    def voice_client(self):
+        return self.guild.voice_client
+
+    async def send(self, content):
+        self.sent.append(content)
+        return FakeMessage(content)
+
+    async def invoke(self, command, *args, **kwargs):
+        """!start의 자동 종료 타이머가 !stop을 호출하는 경로"""
+        voice_client = self.guild.voice_client
+        if voice_client is not None and voice_client.stopped_by is None:
+            voice_client.stopped_by = self
+        started = time.monotonic()
+        try:
+            return await command.callback(self, *args, **kwargs)
+        finally:
+            self.auto_stop_latency = time.monotonic() - started
+
+
+class StubRecognizer:
+    """recognize_google 대체 - 스레드에서 블로킹 호출"""
+    def __init__(self, options):
+        self.options = options
+
+    def __call__(self, audio):
+        options = self.options
+        time.sleep(sample_latency(options.stt_latency, options.stt_tail_prob, options.stt_tail_factor))
+        return "안녕하세요 부하 테스트 회의 내용입니다"
+
+
+class FakeCompletions:
+    """OpenAI chat.completions 대체"""
+    def __init__(self, options):
+        self.options = options
+
+    async def create(self, model, messages, **kwargs):
+        await asyncio.sleep(sample_latency(self.options.openai_latency, 0.01, 5))
+        content = (
+            "1. 주요 안건:\n부하 테스트 안건\n\n"
+            "2. 논의 내용:\n부하 테스트 논의\n\n"
+            "3. 주요 결정사항:\n부하 테스트 결정\n\n"
+            "4. 후속 조치:\n부하 테스트 후속 조치"
+        )
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeModels:
+    """OpenAI models 대체 (상태 확인용 모델 조회)"""
+    def __init__(self, options):
+        self.options = options
+
+    async def retrieve(self, model):
+        await asyncio.sleep(sample_latency(self.options.openai_latency, 0.01, 5))
+        return SimpleNamespace(id=model)
+
+
+class FakeNotion:
+    """notion_client.Client 대체 - 실제 클라이언트처럼 동기(블로킹) 호출"""
+    def __init__(self, options):
+        self.options = options
+        self.pages = self
+        self.databases = self
+        self.users = self
+
+    def _request(self):
+        time.sleep(sample_latency(self.options.notion_latency, 0.01, 5))
+        if random.random() < self.options.notion_error_rate:
+            raise RuntimeError("Notion 대체 구현 오류 (주입)")
+
+    def create(self, **page):
+        self._request()
+        return {"id": str(uuid.uuid4())}
+
+    def retrieve(self, **kwargs):
+        self._request()
+        return {}
+
+    def list(self, **kwargs):
+        self._request()
+        return {}
+
+
+class Metrics:
+    """부하 테스트 측정값"""
+    def __init__(self):
+        self.started = 0
+        self.completed = 0
+        self.auto_stopped = 0
+        self.failures = {}
+        self.title_mismatches = 0
+        self.completion_latencies = []
+        self.loop_lags = []
+        self.rss_samples = []
+
+    def fail(self, reason):
+        self.failures[reason] = self.failures.get(reason, 0) + 1
+
+
+def rss_mb():
+    """현재 프로세스 메모리 사용량 (MB)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError):
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage / 2 ** 20 if sys.platform == 'darwin' else usage / 2 ** 10
+
+
+def temp_files():
+    """남아 있는 임시 오디오 파일"""
+    return glob.glob('temp_chunk_*.wav') + glob.glob('meeting_*.wav')
+
+
+def recording_threads():
+    """녹음 스레드 (executor 스레드 풀과 메인 스레드 제외)"""
+    return [t for t in threading.enumerate()
+            if t is not threading.main_thread() and not t.name.startswith('asyncio_')]
+
+
+async def monitor_loop_lag(metrics, stop_event, interval=0.1):
+    """이벤트 루프 지연 측정"""
+    while not stop_event.is_set():
+        expected = time.monotonic() + interval
+        await asyncio.sleep(interval)
+        metrics.loop_lags.append(max(0.0, time.monotonic() - expected))
+
+
+async def run_guild(index, options, metrics, deadline, timers):
+    """한 길드에서 회의를 반복 실행"""
+    guild = SimpleNamespace(id=10_000 + index, voice_client=None)
+    members = [SimpleNamespace(name=f"user{index}_{n}") for n in range(random.randint(2, 8))]
+    voice_channel = FakeVoiceChannel(guild, f"voice-{index}", members, options.rate, options.channels)
+    meeting_no = 0
+
+    # 길드마다 시작 시점 분산
+    await asyncio.sleep(random.uniform(0, options.idle))
+    while time.monotonic() < deadline:
+        meeting_no += 1
+        title = f"guild{index} meeting{meeting_no}"
+        ctx = FakeContext(guild, 20_000 + index, voice_channel)
+
+        metrics.started += 1
+        connect_count = voice_channel.connect_count
+        timer = asyncio.create_task(app.start.callback(ctx, title=title, duration=options.duration))
+        timers.add(timer)
+        timer.add_done_callback(timers.discard)
+
+        await asyncio.sleep(random.uniform(0.5, 1.5) * options.meeting_length)
+        if voice_channel.connect_count == connect_count:
+            metrics.fail('start failed')
+            continue
+        receiver = voice_channel.last_connection
+
+        if receiver.stopped_by is None:
+            receiver.stopped_by = ctx
+            started = time.monotonic()
+            await app.stop.callback(ctx)
+            latency = time.monotonic() - started
+        elif receiver.stopped_by is ctx:
+            # 이 회의의 자동 종료 타이머가 먼저 종료함 (--duration)
+            metrics.auto_stopped += 1
+            while ctx.auto_stop_latency is None:
+                await asyncio.sleep(0.1)
+            latency = ctx.auto_stop_latency
+        else:
+            # 이전 회의의 자동 종료 타이머가 이 회의를 종료함
+            metrics.fail('stale auto-stop')
+            continue
+        metrics.completion_latencies.append(latency)
+
+        if guild.voice_client is receiver:
+            metrics.fail('voice client not disconnected')
+        if any('Notion에 저장되었습니다' in m for m in ctx.sent):
+            metrics.completed += 1
+            summary = next((m for m in ctx.sent if m.startswith('회의 요약:')), '')
+            if f"# {title}\n" not in summary:
+                metrics.title_mismatches += 1
+        elif any(m.startswith('⚠️') and '채널에 전송합니다' in m for m in ctx.sent):
+            metrics.fail('backend unhealthy')
+        else:
+            error = next((m for m in reversed(ctx.sent) if '오류' in m), 'unknown')
+            metrics.fail(error.split(':')[0])
+
+        await asyncio.sleep(random.uniform(0.5, 1.5) * options.idle)
+
+
+def report(metrics, started, baseline_rss, baseline_threads, timers, final=False):
+    """측정 결과 출력"""
+    elapsed = time.monotonic() - started
+    lat = metrics.completion_latencies
+    lags = metrics.loop_lags
+    rss = rss_mb()
+    metrics.rss_samples.append(rss)
+
+    lines = []
+    lines.append(f"\n=== 부하 테스트 {'최종 ' if final else ''}결과 ({elapsed / 60:.1f}분 경과) ===")
+    lines.append(f"회의: 시작 {metrics.started}, 완료 {metrics.completed}, 자동 종료 {metrics.auto_stopped}, "
+                 f"처리량 {metrics.completed / elapsed * 60:.2f}건/분")
+    lines.append(f"실패: {metrics.failures or '없음'}, 제목 불일치: {metrics.title_mismatches}")
+    lines.append(f"!stop 완료 지연 p50/p95/p99/max: {app.format_ms(app.percentile(lat, 50))} / "
+                 f"{app.format_ms(app.percentile(lat, 95))} / {app.format_ms(app.percentile(lat, 99))} / "
+                 f"{app.format_ms(max(lat) if lat else None)}")
+    lines.append(f"이벤트 루프 지연 p50/p99/max: {app.format_ms(app.percentile(lags, 50))} / "
+                 f"{app.format_ms(app.percentile(lags, 99))} / {app.format_ms(max(lags) if lags else None)}")
+    lines.append(f"메모리(RSS): 시작 {baseline_rss:.1f}MB, 현재 {rss:.1f}MB, "
+                 f"최대 {max(metrics.rss_samples):.1f}MB, 증가 {rss - baseline_rss:+.1f}MB")
+    lines.append(f"스레드: 전체 {threading.active_count()} (시작 {baseline_threads}), "
+                 f"녹음 스레드 {len(recording_threads())}, 대기 중인 자동 종료 타이머 {len(timers)}")
+    lines.append(f"임시 파일: {len(temp_files())}")
+
+    for key in ('openai', 'notion'):
+        health = app.bot.health_monitor.stats(key)
+        lines.append(f"상태 확인({app.BACKEND_NAMES[key]}): 최근 {health['checks']}회, "
+                     f"p50/p95 {app.format_ms(health['p50'])} / {app.format_ms(health['p95'])}, "
+                     f"오류율 {health['error_rate'] * 100:.0f}%")
+
+    stats = app.speech_recognizer.stats()
+    lines.append(f"음성 인식: 요청 {stats['requests']}, 헤징 비율 {stats['hedge_rate'] * 100:.1f}%, "
+                 f"응답 p99 {app.format_ms(stats['response_p99'])} (헤징 없을 때 {app.format_ms(stats['primary_p99'])})")
+    print("\n".join(lines), flush=True)
+
+
+async def main(options):
+    random.seed(options.seed)
+
+    # 외부 API 대체 구현 연결
+    app.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(options)),
+                                 models=FakeModels(options))
+    app.bot.notion = FakeNotion(options)
+    app.speech_recognizer.enabled = options.hedging
+    app.speech_recognizer.recognize_fn = StubRecognizer(options)
+
+    metrics = Metrics()
+    timers = set()
+    stop_event = asyncio.Event()
+    baseline_rss = rss_mb()
+    baseline_threads = threading.active_count()
+    metrics.rss_samples.append(baseline_rss)
+
+    # setup_hook과 같이 첫 확인 후 백그라운드 상태 확인 시작
+    health_monitor = app.bot.health_monitor
+    health_monitor.interval = options.health_interval
+    await health_monitor.probe_all(['openai', 'notion'])
+    health_monitor.start()
+
+    started = time.monotonic()
+    deadline = started + options.hours * 3600
+    lag_task = asyncio.create_task(monitor_loop_lag(metrics, stop_event))
+    guilds = asyncio.gather(*(run_guild(i, options, metrics, deadline, timers)
+                              for i in range(options.meetings)))
+
+    while not guilds.done():
+        await asyncio.wait([guilds], timeout=options.report_interval)
+        if not guilds.done():
+            report(metrics, started, baseline_rss, baseline_threads, timers)
+    guilds.result()
+
+    stop_event.set()
+    await lag_task
+    health_monitor.stop()
+    # 녹음 스레드와 executor 작업 정리 대기
+    await asyncio.sleep(1)
+    report(metrics, started, baseline_rss, baseline_threads, timers, final=True)
+
+    for timer in list(timers):
+        timer.cancel()
+    await asyncio.gather(*timers, return_exceptions=True)
+    # 누수된 녹음 스레드가 프로세스 종료를 막지 않도록 정리
+    for receiver in list(FakeAudioReceiver.active):
+        await receiver.disconnect()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="MeetingBot 다중 길드 동시 부하 테스트")
+    parser.add_argument('--meetings', type=int, default=10, help="동시에 진행할 회의(길드) 수")
+    parser.add_argument('--hours', type=float, default=0.05, help="테스트 실행 시간 (시간)")
+    parser.add_argument('--meeting-length', type=float, default=20, help="평균 회의 길이 (초)")
+    parser.add_argument('--duration', type=float, default=60, help="!start 자동 종료 시간 (분)")
+    parser.add_argument('--idle', type=float, default=5, help="회의 사이 평균 대기 시간 (초)")
+    parser.add_argument('--rate', type=int, default=44100, help="합성 오디오 샘플링 레이트")
+    parser.add_argument('--channels', type=int, default=2, help="합성 오디오 채널 수")
+    parser.add_argument('--stt-latency', type=float, default=1.0, help="음성 인식 중앙값 지연 (초)")
+    parser.add_argument('--stt-tail-prob', type=float, default=0.03, help="음성 인식 느린 응답 확률")
+    parser.add_argument('--stt-tail-factor', type=float, default=6, help="느린 응답의 지연 배수")
+    parser.add_argument('--hedging', action='store_true', help="음성 인식 요청 헤징 사용")
+    parser.add_argument('--openai-latency', type=float, default=1.5, help="OpenAI 중앙값 지연 (초)")
+    parser.add_argument('--notion-latency', type=float, default=0.3, help="Notion 중앙값 지연 (초, 블로킹)")
+    parser.add_argument('--notion-error-rate', type=float, default=0.0, help="Notion 요청 실패 확률")
+    parser.add_argument('--health-interval', type=float, default=10, help="백엔드 상태 확인 주기 (초)")
+    parser.add_argument('--report-interval', type=float, default=60, help="중간 결과 출력 간격 (초)")
+    parser.add_argument('--workdir', default=None, help="임시 파일 작업 디렉터리 (기본: 새 임시 디렉터리)")
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    options = parse_args()
+    # 임시 파일 누수를 확인할 수 있도록 별도 디렉터리에서 실행
+    os.chdir(options.workdir or tempfile.mkdtemp(prefix='meetingbot_loadtest_'))
+    print(f"작업 디렉터리: {os.getcwd()}")
+    asyncio.run(main(options))